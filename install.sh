@@ -1,6 +1,6 @@
 #/bin/bash
 
-LINUX_TYPE=`grep -E -w 'NAME' /etc/os-release | sed -e "s/NAME=//g" | sed -e "s/\"//g"`
+LINUX_TYPE=`. /etc/os-release && echo "$NAME"`
 
 echo LINUX_TYPE=$LINUX_TYPE
 
@@ -17,6 +17,6 @@ sudo chmod a+r /etc/apt/keyrings/docker.gpg
 
 make prepare
 
-python3 -m venv ~/dkenv
-~/dkenv/bin/pip install setuptools
-~/dkenv/bin/pip install dagknows --force-reinstall
+DKENV=${HOME}/dkenv
+python3 -m venv ${DKENV}
+${DKENV}/bin/pip install --upgrade setuptools dagknows
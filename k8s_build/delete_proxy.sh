@@ -8,20 +8,26 @@ if [ x"$PROXY_NAMESPACE" = "x" ]; then
   exit 1
 fi
 
+PVCS=`kubectl -n $PROXY_NAMESPACE get pvc -o name`
+PVS=`kubectl get pv -o name | grep "$PROXY_NAMESPACE-"`
 
 echo "kubectl -n $PROXY_NAMESPACE delete deploy --all"
-for res in `kubectl -n $PROXY_NAMESPACE get pvc -o name`
+for res in $PVCS
 do
   echo "kubectl -n $PROXY_NAMESPACE patch $res  -p '{"metadata": {"finalizers": null}}'"
-  echo "kubectl -n $PROXY_NAMESPACE delete $res"
 done
+if [ x"$PVCS" != "x" ]; then
+  echo "kubectl -n $PROXY_NAMESPACE delete" $PVCS
+fi
 
 echo "Patching and deleting all PVs for proxy..."
-for res in `kubectl get pv -o name | grep "$PROXY_NAMESPACE-"`
+for res in $PVS
 do
   echo "kubectl patch $res  -p '{"metadata": {"finalizers": null}}'"
-  echo "kubectl delete $res"
 done
+if [ x"$PVS" != "x" ]; then
+  echo "kubectl delete" $PVS
+fi
 
 echo "kubectl delete ns $PROXY_NAMESPACE"
 
@@ -30,20 +36,24 @@ if [ x"$COMMIT" = "xyes" ]; then
   kubectl -n $PROXY_NAMESPACE delete deploy --all
 
   echo "Patching and deleting all PVCs for proxy..."
-  for res in `kubectl -n $PROXY_NAMESPACE get pvc -o name`
+  for res in $PVCS
   do
     echo "Patching Res: $res"
     kubectl -n $PROXY_NAMESPACE patch $res  -p '{"metadata": {"finalizers": null}}'
-    kubectl -n $PROXY_NAMESPACE delete $res
   done
+  if [ x"$PVCS" != "x" ]; then
+    kubectl -n $PROXY_NAMESPACE delete $PVCS
+  fi
 
   echo "Patching and deleting all PVs for proxy..."
-  for res in `kubectl get pv -o name | grep "$PROXY_NAMESPACE-"`
+  for res in $PVS
   do
     echo "Patching Res: $res"
     kubectl patch $res  -p '{"metadata": {"finalizers": null}}'
-    kubectl delete $res
   done
+  if [ x"$PVS" != "x" ]; then
+    kubectl delete $PVS
+  fi
 
   echo "Deleting namespace...."
   kubectl delete ns $PROXY_NAMESPACE
@@ -30,6 +30,11 @@ import traceback
 
 logger = logging.getLogger()
 
+IPV4_ADDR_RE = re.compile(r'(\d+\.\d+\.\d+\.\d+)', re.IGNORECASE)
+PERIOD_DAYS_RE = re.compile(r"(\d+)\s*d|(\d+)\s*day|(\d+)\s*days", re.IGNORECASE)
+PERIOD_HOURS_RE = re.compile(r"(\d+)\s*h|(\d+)\s*hr|(\d+)\s*hrs|(\d+)\s*hour|(\d+)\s*hours", re.IGNORECASE)
+PERIOD_MINS_RE = re.compile(r"(\d+)\s*m|(\d+)\s*min|(\d+)\s*mins|(\d+)\s*minute|(\d+)\s*minutes", re.IGNORECASE)
+
 class jira:
     def __init__(self, daglib):
        self.dag = daglib
@@ -207,7 +212,7 @@ class prolog:
                 return datetime.datetime.timestamp(matches[0])
             else:
                 return None
-        except:
+        except Exception:
             return None
 
     def get_tstp(self, line):
@@ -263,14 +268,13 @@ class prolog:
         started = False
         for line in self.lines:
             tstp = self.get_tstp(line)
-            print("Line: ", line, file=sys.stdout)
-            print("Tstp: ", tstp, file=sys.stdout)
-            print("start: ", start_tstp, " end_tstp: ", end_tstp, file=sys.stdout)
+            out = f"Line:  {line}\nTstp:  {tstp}\nstart:  {start_tstp}  end_tstp:  {end_tstp}\n"
+            if (tstp or started):
+                out += "Line is good\n"
+            sys.stdout.write(out)
             sys.stdout.flush()
 
             if (tstp or started):
-                print("Line is good", file=sys.stdout)
-                sys.stdout.flush()
                 if started or (tstp and (tstp >= start_tstp and tstp <= end_tstp)):
                     filtered.append(line)
                 if self.reverse:
@@ -311,13 +315,15 @@ class prolog:
 
     def get_containing_any(self, strings):
         plg = prolog()
+        lstrings = [string.lower() for string in strings]
         for line in self.lines:
             # print("Line: ", line, file=sys.stdout)
             # sys.stdout.flush()
-            for string in strings:
+            lline = line.lower()
+            for string in lstrings:
                 # print("String: ", string, file=sys.stdout)
                 # sys.stdout.flush()
-                if (string.lower() in line.lower()):
+                if (string in lline):
                     plg.lines.append(line)
                     # print("Found: ", string, file=sys.stdout)
                     # sys.stdout.flush()
@@ -330,10 +336,12 @@ class prolog:
     def get_containing_all(self, strings):
         plg = prolog()
         filtered = []
+        lstrings = [string.lower() for string in strings]
         for line in self.lines:
             match = True
-            for string in strings:
-                if (string.lower() not in line.lower()):
+            lline = line.lower()
+            for string in lstrings:
+                if (string not in lline):
                     match = False
                     break
             if match:
@@ -345,8 +353,9 @@ class prolog:
 
     def get_containing(self, string):
         plg = prolog()
+        lstring = string.lower()
         for line in self.lines:
-            if (string.lower() in line.lower()):
+            if (lstring in line.lower()):
                plg.lines.append(line)
         if self.reverse:
            plg.lines.reverse()
@@ -355,7 +364,7 @@ class prolog:
     def get_ipv4_addr(self):
         plg = prolog()
         for line in self.lines:
-            m = re.search('(\d+\.\d+\.\d+\.\d+)', line, flags=re.IGNORECASE)
+            m = IPV4_ADDR_RE.search(line)
             if m:
                plg.lines.append(m.group(1))
         if self.reverse:
@@ -365,7 +374,7 @@ class prolog:
     def get_num_after(self, st):
         plg = prolog()
         for line in self.lines:
-            m = re.search(st+'\s*(-?\d+\.?\d+)', line, flags=re.IGNORECASE)
+            m = re.search(st+r'\s*(-?\d+\.?\d+)', line, flags=re.IGNORECASE)
             if m:
                if "." in m.group(1):
                   plg.lines.append(float(m.group(1)))
@@ -378,7 +387,7 @@ class prolog:
     def get_num_before(self, st):
         plg = prolog()
         for line in self.lines:
-            m = re.search('(-?\d+\.?\d+)\s*'+st, line, flags=re.IGNORECASE)
+            m = re.search(r'(-?\d+\.?\d+)\s*'+st, line, flags=re.IGNORECASE)
             if m:
                if "." in m.group(1):
                   plg.lines.append(float(m.group(1)))
@@ -613,7 +622,7 @@ class daglib:
        try:
            json.dumps(x)
            return True
-       except:
+       except Exception:
            return False
 
     def only_jsonable(self, mydict):
@@ -646,17 +655,17 @@ class daglib:
         period = period_str
         max_data_points = 1430
 
-        tt = re.search("(\d+)\s*d|(\d+)\s*day|(\d+)\s*days", period_str, re.IGNORECASE)
+        tt = PERIOD_DAYS_RE.search(period_str)
         if tt:
             days = tt.group(1)
             period = int(days) * 3600 *24
 
-        tt = re.search("(\d+)\s*h|(\d+)\s*hr|(\d+)\s*hrs|(\d+)\s*hour|(\d+)\s*hours", period_str, re.IGNORECASE)
+        tt = PERIOD_HOURS_RE.search(period_str)
         if tt:
             hours = tt.group(1)
             period = int(hours) * 3600
 
-        tt = re.search("(\d+)\s*m|(\d+)\s*min|(\d+)\s*mins|(\d+)\s*minute|(\d+)\s*minutes", period_str, re.IGNORECASE)
+        tt = PERIOD_MINS_RE.search(period_str)
         if tt:
             minutes = tt.group(1)
             period = int(minutes) * 60
@@ -676,8 +685,9 @@ class daglib:
 
         interval = str(interval)
 
-        now = datetime.datetime.now().timestamp()
-        end_time = datetime.datetime.now().isoformat()
+        now_dt = datetime.datetime.now()
+        now = now_dt.timestamp()
+        end_time = now_dt.isoformat()
         then = now - period
         start_time = datetime.datetime.fromtimestamp(then).isoformat()
 